@@ -599,6 +599,128 @@ def append_colorbar(ci, ax, size=2, labelsize=9, **kwargs):
     return cb
 
 
+def _get_display_data_kind(VarInst, data=None):
+    """Resolve and validate the kind of data to display for a Variable.
+
+    Used internally by the display functions. Looks up the :obj:`data`
+    argument (or the default for the `VarInst`) in the class-level style map
+    of the `VarInst`, and checks that the `VarInst` knows the information
+    needed to display that kind of data. Returns the kind of data
+    (`'spacetime'`, `'preserved'`, or `'stratigraphy'`).
+
+    Raises
+    ------
+    TypeError
+        If :obj:`VarInst` is not a supported Variable type.
+
+    ValueError
+        If :obj:`data` is not a supported option.
+
+    NoStratigraphyError
+        If `'preserved'` or `'stratigraphy'` data is requested from a
+        `DataSectionVariable` that does not know stratigraphy.
+
+    AttributeError
+        If `'spacetime'` or `'preserved'` data is requested from a
+        `StratigraphySectionVariable`.
+    """
+    if not isinstance(VarInst, (section.DataSectionVariable,
+                                section.StratigraphySectionVariable)):
+        raise TypeError('Invaid "VarInst" type: %s' % type(VarInst))
+    data = data or VarInst._default_data
+    _kind = VarInst._style_map.get(data)
+    if _kind is None:
+        raise ValueError('Bad data argument: %s' % str(data))
+    if isinstance(VarInst, section.DataSectionVariable):
+        if _kind != 'spacetime':
+            VarInst._check_knows_stratigraphy()
+    else:
+        if _kind != 'stratigraphy':
+            VarInst._check_knows_spacetime()  # always raises
+    return _kind
+
+
+def _get_display_arrays_kind(VarInst, _kind):
+    """Get display arrays for an already resolved kind of data.
+
+    Used internally; see :obj:`get_display_arrays`.
+    """
+    # #  DataSection  # #
+    if isinstance(VarInst, section.DataSectionVariable):
+        if _kind == 'spacetime':
+            return VarInst, VarInst._S, VarInst._Z
+        elif _kind == 'preserved':
+            return VarInst.as_preserved_nan(), VarInst._S, VarInst._Z
+        elif _kind == 'stratigraphy':
+            _den = VarInst.as_stratigraphy()
+            _arr_Y = VarInst.strat_attr['psvd_flld'][:_den.shape[0], ...]
+            _arr_X = np.broadcast_to(VarInst._s, _den.shape)
+            return _den[1:, 1:], _arr_X, _arr_Y
+    # #  StratigraphySection  # #
+    else:
+        return VarInst, VarInst._S, VarInst._Z
+
+
+def _get_display_limits_kind(VarInst, _kind):
+    """Get display limits for an already resolved kind of data.
+
+    Used internally; see :obj:`get_display_limits`. Limits are computed
+    from the 1-D coordinate arrays, not the coordinate mesh.
+    """
+    # #  DataSection  # #
+    if isinstance(VarInst, section.DataSectionVariable):
+        if _kind == 'stratigraphy':
+            # strata are non-decreasing in time along each column, so
+            #   the extremes are found in the first and last rows
+            _strata = VarInst.strat_attr['strata']
+            return np.min(VarInst._s), np.max(VarInst._s), \
+                np.min(_strata[0, :]), np.max(_strata[-1, :]) * 1.5
+        else:
+            return np.min(VarInst._s), np.max(VarInst._s), \
+                np.min(VarInst._z), np.max(VarInst._z)
+    # #  StratigraphySection  # #
+    else:
+        return np.min(VarInst._s), np.max(VarInst._s), \
+            np.min(VarInst._z), np.max(VarInst._z) * 1.5
+
+
+def _get_display_lines_kind(VarInst, _kind):
+    """Get display lines for an already resolved kind of data.
+
+    Used internally; see :obj:`get_display_lines`.
+    """
+    # #  DataSection  # #
+    if isinstance(VarInst, section.DataSectionVariable):
+        def _build_segments(S, Z):
+            # util for building (s, z) segments between adjacent columns,
+            #   filled from views of S and Z into a single allocation
+            _seg = np.empty((S.shape[0], S.shape[1] - 1, 2, 2),
+                            dtype=np.result_type(S, Z))
+            _seg[:, :, 0, 0] = S[:, :-1]
+            _seg[:, :, 1, 0] = S[:, 1:]
+            _seg[:, :, 0, 1] = Z[:, :-1]
+            _seg[:, :, 1, 1] = Z[:, 1:]
+            return _seg.reshape(-1, 2, 2)
+        if _kind == 'spacetime':
+            z = VarInst._Z
+            vals = VarInst[:, :-1]
+        elif _kind == 'preserved':
+            z = VarInst._Z
+            vals = VarInst._as_preserved_display()[:, :-1]
+        elif _kind == 'stratigraphy':
+            z = VarInst.strat_attr['strata']  # read only, no copy
+            vals = VarInst[:, :-1]
+        segments = _build_segments(VarInst._S, z)
+        if _kind == 'stratigraphy':
+            # flip = draw late to early (views, no copy)
+            vals = vals[::-1, ::-1]
+            segments = segments[::-1]
+        return vals, segments
+    # #  StratigraphySection  # #
+    else:
+        raise NotImplementedError  # not sure best implementation
+
+
 def get_display_arrays(VarInst, data=None):
     """Get arrays for display of Variables.
 
@@ -631,34 +753,8 @@ def get_display_arrays(VarInst, data=None):
     """
     # # #  SectionVariables  # # #
     if issubclass(type(VarInst), section.BaseSectionVariable):
-        # #  DataSection  # #
-        if isinstance(VarInst, section.DataSectionVariable):
-            data = data or VarInst._default_data
-            if data in VarInst._spacetime_names:
-                return VarInst, VarInst._S, VarInst._Z
-            elif data in VarInst._preserved_names:
-                return VarInst.as_preserved(), VarInst._S, VarInst._Z
-            elif data in VarInst._stratigraphy_names:
-                _sp = VarInst.as_stratigraphy()
-                _den = _sp.toarray().view(section.DataSectionVariable)
-                _arr_Y = VarInst.strat_attr['psvd_flld'][:_sp.shape[0], ...]
-                _arr_X = np.tile(VarInst._s, (_sp.shape[0], 1))
-                return _den[1:, 1:], _arr_X, _arr_Y
-            else:
-                raise ValueError('Bad data argument: %s' % str(data))
-        # #  StratigraphySection  # #
-        elif isinstance(VarInst, section.StratigraphySectionVariable):
-            data = data or VarInst._default_data
-            if data in VarInst._spacetime_names:
-                VarInst._check_knows_spacetime()  # always False
-            elif data in VarInst._preserved_names:
-                VarInst._check_knows_spacetime()  # always False
-            elif data in VarInst._stratigraphy_names:
-                return VarInst, VarInst._S, VarInst._Z
-            else:
-                raise ValueError('Bad data argument: %s' % str(data))
-        else:
-            raise TypeError
+        _kind = _get_display_data_kind(VarInst, data)
+        return _get_display_arrays_kind(VarInst, _kind)
 
     # # #  PlanformVariables  # # #
     elif False:  # issubclass(type(VarInst), plan.BasePlanformVariable):
@@ -701,45 +797,8 @@ def get_display_lines(VarInst, data=None):
     """
     # # #  SectionVariables  # # #
     if issubclass(type(VarInst), section.BaseSectionVariable):
-        # #  DataSection  # #
-        if isinstance(VarInst, section.DataSectionVariable):
-            def _reshape_long(X):
-                # util for reshaping s- and z-values appropriately
-                return np.vstack((X[:, :-1].flatten(),
-                                  X[:, 1:].flatten())).T.reshape(-1, 2, 1)
-            data = data or VarInst._default_data
-            if data in VarInst._spacetime_names:
-                z = _reshape_long(VarInst._Z)
-                vals = VarInst[:, :-1]
-            elif data in VarInst._preserved_names:
-                z = _reshape_long(VarInst._Z)
-                vals = VarInst.as_preserved()[:, :-1]
-            elif data in VarInst._stratigraphy_names:
-                VarInst._check_knows_stratigraphy()  # need to check explicitly
-                z = _reshape_long(np.copy(VarInst.strat_attr['strata']))
-                vals = VarInst[:, :-1]
-            else:
-                raise ValueError('Bad data argument: %s' % str(data))
-            s = _reshape_long(VarInst._S)
-            segments = np.concatenate([s, z], axis=2)
-            if data in VarInst._stratigraphy_names:
-                # flip = draw late to early
-                vals = np.fliplr(np.flipud(vals))
-                segments = np.flipud(segments)
-            return vals, segments
-        # #  StratigraphySection  # #
-        elif isinstance(VarInst, section.StratigraphySectionVariable):
-            data = data or VarInst._default_data
-            if data in VarInst._spacetime_names:
-                VarInst._check_knows_spacetime()  # always False
-            elif data in VarInst._preserved_names:
-                VarInst._check_knows_spacetime()  # always False
-            elif data in VarInst._stratigraphy_names:
-                raise NotImplementedError  # not sure best implementation
-            else:
-                raise ValueError('Bad data argument: %s' % str(data))
-        else:
-            raise TypeError
+        _kind = _get_display_data_kind(VarInst, data)
+        return _get_display_lines_kind(VarInst, _kind)
 
     # # #  PlanformVariables  # # #
     elif False:  # issubclass(type(VarInst), plan.BasePlanformVariable):
@@ -776,39 +835,49 @@ def get_display_limits(VarInst, data=None):
     """
     # # #  SectionVariables  # # #
     if issubclass(type(VarInst), section.BaseSectionVariable):
-        # #  DataSection  # #
-        if isinstance(VarInst, section.DataSectionVariable):
-            data = data or VarInst._default_data
-            if data in VarInst._spacetime_names:
-                return np.min(VarInst._S), np.max(VarInst._S), \
-                    np.min(VarInst._Z), np.max(VarInst._Z)
-            elif data in VarInst._preserved_names:
-                VarInst._check_knows_stratigraphy()  # need to check explicitly
-                return np.min(VarInst._S), np.max(VarInst._S), \
-                    np.min(VarInst._Z), np.max(VarInst._Z)
-            elif data in VarInst._stratigraphy_names:
-                VarInst._check_knows_stratigraphy()  # need to check explicitly
-                _strata = np.copy(VarInst.strat_attr['strata'])
-                return np.min(VarInst._S), np.max(VarInst._S), \
-                    np.min(_strata), np.max(_strata) * 1.5
-            else:
-                raise ValueError('Bad data argument: %s' % str(data))
-
-        # #  StratigraphySection  # #
-        elif isinstance(VarInst, section.StratigraphySectionVariable):
-            data = data or VarInst._default_data
-            if data in VarInst._spacetime_names:
-                VarInst._check_knows_spacetime()  # always False
-            elif data in VarInst._preserved_names:
-                VarInst._check_knows_spacetime()  # always False
-            elif data in VarInst._stratigraphy_names:
-                return np.min(VarInst._S), np.max(VarInst._S), \
-                    np.min(VarInst._Z), np.max(VarInst._Z) * 1.5
-            else:
-                raise ValueError('Bad data argument: %s' % str(data))
+        _kind = _get_display_data_kind(VarInst, data)
+        return _get_display_limits_kind(VarInst, _kind)
 
-        else:
-            raise TypeError
+    # # #  PlanformVariables  # # #
+    elif False:  # issubclass(type(VarInst), plan.BasePlanformVariable):
+        raise NotImplementedError
+    else:
+        raise TypeError('Invaid "VarInst" type: %s' % type(VarInst))
+
+
+def get_display_bundle(VarInst, data=None):
+    """Get arrays and limits for display of Variables.
+
+    Equivalent to calling :obj:`get_display_arrays` and then
+    :obj:`get_display_limits` with the same arguments, but the :obj:`data`
+    argument is resolved and validated (including the check that the
+    Variable knows the needed stratigraphy information) a single time,
+    rather than once per call.
+
+    Parameters
+    ----------
+    VarInst : :obj:`~deltametrics.section.BaseSectionVariable` subclass
+        The `Variable` instance to visualize. May be any subclass of
+        :obj:`~deltametrics.section.BaseSectionVariable` or
+        :obj:`~deltametrics.plan.BasePlanformVariable`.
+
+    data : :obj:`str`, optional
+        The type of data to visualize. Supported options are `'spacetime'`,
+        `'preserved'`, and `'stratigraphy'`. See :obj:`get_display_arrays`
+        for the default.
+
+    Returns
+    -------
+    data, X, Y, xmin, xmax, ymin, ymax
+        The display arrays, as from :obj:`get_display_arrays`, followed by
+        the display limits, as from :obj:`get_display_limits`.
+    """
+    # # #  SectionVariables  # # #
+    if issubclass(type(VarInst), section.BaseSectionVariable):
+        _kind = _get_display_data_kind(VarInst, data)
+        _data, _X, _Y = _get_display_arrays_kind(VarInst, _kind)
+        xmin, xmax, ymin, ymax = _get_display_limits_kind(VarInst, _kind)
+        return _data, _X, _Y, xmin, xmax, ymin, ymax
 
     # # #  PlanformVariables  # # #
     elif False:  # issubclass(type(VarInst), plan.BasePlanformVariable):
@@ -3,6 +3,7 @@ import warnings
 
 import numpy as np
 from scipy import sparse
+from numba import njit, prange
 
 import matplotlib.pyplot as plt
 from matplotlib.collections import LineCollection
@@ -28,10 +29,16 @@ class BaseSectionVariable(np.ndarray):
         Subclasses should implement the ``__init__`` method.
 
     """
-    _spacetime_names = ['full', 'spacetime', 'as spacetime', 'as_spacetime']
-    _preserved_names = ['psvd', 'preserved', 'as preserved', 'as_preserved']
-    _stratigraphy_names = ['strat', 'strata', 'stratigraphy',
-                           'as stratigraphy', 'as_stratigraphy']
+    _spacetime_names = frozenset({'full', 'spacetime', 'as spacetime',
+                                  'as_spacetime'})
+    _preserved_names = frozenset({'psvd', 'preserved', 'as preserved',
+                                  'as_preserved'})
+    _stratigraphy_names = frozenset({'strat', 'strata', 'stratigraphy',
+                                     'as stratigraphy', 'as_stratigraphy'})
+    # map every accepted name to the kind of data it refers to
+    _style_map = {**{_n: 'spacetime' for _n in _spacetime_names},
+                  **{_n: 'preserved' for _n in _preserved_names},
+                  **{_n: 'stratigraphy' for _n in _stratigraphy_names}}
 
     def __new__(cls, _data, _s, _z, _psvd_mask=None, **unused_kwargs):
         # Input array is an already formed ndarray instance
@@ -47,7 +54,6 @@ class BaseSectionVariable(np.ndarray):
                 'Shape of "_s" or "_z" incompatible with "_data" array.')
         obj._s = _s
         obj._z = _z
-        obj._S, obj._Z = np.meshgrid(obj._s, obj._z)
         return obj
 
     def __array_finalize__(self, obj):
@@ -56,7 +62,30 @@ class BaseSectionVariable(np.ndarray):
         self._psvd_mask = getattr(obj, '_psvd_mask', None)
         self._s = getattr(obj, '_s', None)
         self._z = getattr(obj, '_z', None)
-        self._S, self._Z = np.meshgrid(self._s, self._z)
+
+    def _compute_mesh(self):
+        """Compute and cache the coordinate mesh.
+
+        The mesh is only needed for display, so it is computed on first
+        access rather than on every view or slice of the array. The mesh
+        arrays are broadcast views of `_s` and `_z` (no copy), and so
+        should be treated as read-only.
+        """
+        _mesh = self.__dict__.get('_mesh_cache')
+        if _mesh is None:
+            _mesh = np.meshgrid(self._s, self._z, copy=False)
+            self.__dict__['_mesh_cache'] = _mesh
+        return _mesh
+
+    @property
+    def _S(self):
+        """Along-section coordinate mesh, matching the shape of the data."""
+        return self._compute_mesh()[0]
+
+    @property
+    def _Z(self):
+        """Vertical coordinate mesh, matching the shape of the data."""
+        return self._compute_mesh()[1]
 
 
 class DataSectionVariable(BaseSectionVariable):
@@ -66,6 +95,7 @@ class DataSectionVariable(BaseSectionVariable):
 
     """
     _default_data = 'spacetime'
+    _jit_scatter_size = 100000  # use compiled scatter above this many voxels
 
     def __init__(self, _data, _s, _z, _psvd_mask=None, _strat_attr=None):
         """Construct the array from section info.
@@ -120,30 +150,119 @@ class DataSectionVariable(BaseSectionVariable):
         Returns
         -------
         ma : :obj:`np.ma.MaskedArray`
-            A numpy MaskedArray with non-preserved values masked.
+            A numpy MaskedArray with non-preserved values masked. The data
+            is shared with the variable, and the mask is a new array.
+        """
+        if self._check_knows_stratigraphy():
+            return np.ma.MaskedArray(self,
+                                     mask=np.logical_not(self._psvd_mask))
+
+    @property
+    def _inv_psvd_mask(self):
+        """Inverted preservation mask, computed on first use and cached.
+
+        Only needed by the display routines, so it is not computed when the
+        variable is created. The cached mask is read-only, because it is
+        shared by every call to :obj:`_as_preserved_display`.
+        """
+        _inv = self.__dict__.get('_inv_psvd_mask_cache')
+        if _inv is None:
+            _inv = np.logical_not(self._psvd_mask)
+            _inv.setflags(write=False)
+            self.__dict__['_inv_psvd_mask_cache'] = _inv
+        return _inv
+
+    def _as_preserved_display(self):
+        """Variable with only preserved values, for internal display use.
+
+        Same as :obj:`as_preserved`, but the mask is the cached (read-only)
+        inverted preservation mask, so repeated calls do not allocate a new
+        mask. Do not modify the returned array.
+        """
+        if self._check_knows_stratigraphy():
+            return np.ma.MaskedArray(self, mask=self._inv_psvd_mask,
+                                     copy=False)
+
+    def as_preserved_nan(self):
+        """Variable with only preserved values, non-preserved set to NaN.
+
+        A lightweight alternative to :obj:`as_preserved`, suitable for
+        display (e.g., matplotlib treats NaN as masked in `pcolormesh`),
+        which avoids the overhead of a `MaskedArray`.
+
+        Returns
+        -------
+        arr : :obj:`ndarray`
+            A numpy array with non-preserved values set to ``np.nan``. The
+            array is floating point, even if the variable is not.
         """
         if self._check_knows_stratigraphy():
-            return np.ma.MaskedArray(self, ~self._psvd_mask)
+            return np.where(self._psvd_mask, np.asarray(self), np.nan)
 
     def as_stratigraphy(self):
         """Variable as preserved stratigraphy.
 
+        The preserved values are placed directly into a dense array, with
+        rows corresponding to the stratigraphic position of each preserved
+        voxel. Positions with no preserved voxel are filled with zeros.
+
         .. warning::
 
-            This method returns a sparse array that is not suitable to be
+            This method returns an array that is not suitable to be
             displayed directly. Use
             :obj:`get_display_arrays(style='stratigraphy')` instead to get
             corresponding x-y coordinates for plotting the array.
+
+        Returns
+        -------
+        strat : :obj:`ndarray`
+            Dense array of preserved values, with shape ``(max(z_sp) + 1,
+            len(s))``.
+        """
+        if self._check_knows_stratigraphy():
+            _z_sp = self.strat_attr['z_sp']
+            _s_sp = self.strat_attr['s_sp']
+            # actual data, where preserved
+            _psvd_data = np.asarray(self[self.strat_attr['psvd_idx']])
+            _den = np.zeros(self.strat_attr['sp_shape'], dtype=self.dtype)
+            if _psvd_data.size > self._jit_scatter_size:
+                _scatter_preserved(_den, _z_sp, _s_sp, _psvd_data)
+            else:
+                _den[_z_sp, _s_sp] = _psvd_data
+            return _den
+
+    def as_stratigraphy_sparse(self):
+        """Variable as preserved stratigraphy, in a sparse matrix.
+
+        Returns
+        -------
+        sp : :obj:`scipy.sparse.coo_matrix`
+            Sparse matrix of preserved values. Same values as
+            :obj:`as_stratigraphy`.
         """
         if self._check_knows_stratigraphy():
             # actual data, where preserved
             _psvd_data = self[self.strat_attr['psvd_idx']]
             _sp = sparse.coo_matrix((_psvd_data,
                                      (self.strat_attr['z_sp'],
-                                      self.strat_attr['s_sp'])))
+                                      self.strat_attr['s_sp'])),
+                                    shape=self.strat_attr['sp_shape'])
             return _sp
 
 
+@njit(parallel=True)
+def _scatter_preserved(out, z_sp, s_sp, data):
+    """Place preserved voxel values into a stratigraphy array.
+
+    Private helper for
+    :obj:`~deltametrics.section.DataSectionVariable.as_stratigraphy`, used
+    for sections with many preserved voxels. Equivalent to
+    ``out[z_sp, s_sp] = data``, with the assignment done in parallel.
+    """
+    for k in prange(data.shape[0]):
+        out[z_sp[k], s_sp[k]] = data[k]
+
+
 class StratigraphySectionVariable(BaseSectionVariable):
     """
     """
@@ -206,6 +325,7 @@ class BaseSection(abc.ABC):
         self._trace = None
         self._shape = None
         self._variables = None
+        self._strat_attr_cache = None
         self.cube = None
 
         self.section_type = section_type
@@ -231,6 +351,7 @@ class BaseSection(abc.ABC):
                                 _gottype=type(CubeInstance)))
         self.cube = CubeInstance
         self._variables = self.cube.variables
+        self._strat_attr_cache = None
         self.name = name  # use the setter to determine the _name
         self._compute_section_coords()
         self._compute_section_attrs()
@@ -266,6 +387,14 @@ class BaseSection(abc.ABC):
             When implementing new section types, be sure that ``self._x`` and
             ``self._y`` are *one-dimensional arrays*, or you will get an
             improperly shaped Section array in return.
+
+        .. note::
+
+            Integer cell coordinates should be generated with
+            ``np.arange(..., dtype=np.intp)``. Any coordinates with a
+            non-integer step should be generated with ``np.linspace``,
+            rather than ``np.arange``, to avoid floating point error in the
+            number of points.
         """
         ...
 
@@ -275,13 +404,26 @@ class BaseSection(abc.ABC):
         Compute the along-section coordinate array from x-y pts pairs
         definining the section.
         """
-        self._s = np.cumsum(np.hstack(
-            (0, np.sqrt((self._x[1:] - self._x[:-1])**2
-             + (self._y[1:] - self._y[:-1])**2))))
+        _d = np.hypot(np.diff(self._x), np.diff(self._y))
+        self._s = np.empty(self._x.size)
+        self._s[:1] = 0
+        np.cumsum(_d, out=self._s[1:])
         self._z = self.cube.z
         self._shape = (len(self._z), len(self._s))
         self._trace = np.column_stack((self._x, self._y))
 
+    @property
+    def _section_index(self):
+        """Index into the `x-y` plane of the cube to extract the section.
+
+        Returns a tuple of ``(y, x)`` indices, used to slice the underlying
+        cube data as ``cube[var][:, y, x]``. By default these are the
+        ``self._y`` and ``self._x`` coordinate arrays (advanced indexing,
+        which copies). Subclasses may override to return scalars or slices
+        where possible, so that the data slice is a view.
+        """
+        return self._y, self._x
+
     @property
     def trace(self):
         """Coordinates of the section in the x-y plane.
@@ -344,33 +486,80 @@ class BaseSection(abc.ABC):
         -------
         SectionVariable : :obj:`~deltametrics.section.SectionVariable` instance
             SectionVariable instance for variable ``var``.
+
+        .. note::
+
+            A new SectionVariable is created on every call. The stratigraphy
+            attributes of the section (:obj:`strat_attr`) do not depend on
+            the variable, so they are computed once and shared by every
+            SectionVariable from the section, until the cube is reconnected
+            or its stratigraphy recomputed. The arrays in the shared
+            attributes are read-only.
+
+        .. note::
+
+            For a :obj:`StrikeSection`, the data is a read-only view of the
+            cube data, so that in-place operations cannot modify the cube.
+            Copy the data (e.g., ``np.array(section[var])``) to get a
+            writable array.
         """
+        if self.cube is None:
+            raise AttributeError(
+                'No cube connected. Are you sure you ran `.connect()`?')
+        _y, _x = self._section_index
+        _is_view = isinstance(_x, slice)
+
+        def _slice(_arr):
+            # slice into the cube array, protecting the cube if a view
+            _arr = _arr[:, _y, _x]
+            if _is_view:
+                _arr = _arr.view()
+                _arr.setflags(write=False)
+            return _arr
+
         if type(self.cube) is cube.DataCube:
             if self.cube._knows_stratigraphy:
+                _strat_attr = self._get_section_strat_attr()
                 return DataSectionVariable(
-                    _data=self.cube[var].data.values[:, self._y, self._x],
+                    _data=_slice(self.cube[var].data.values),
                     _s=self.s, _z=self.z,
-                    _psvd_mask=self.cube.strat_attr.psvd_idx[:, self._y, self._x],  # noqa: E501
-                    _strat_attr=self.cube.strat_attr(
-                        'section', self._y, self._x)
+                    _psvd_mask=_strat_attr['psvd_idx'],
+                    _strat_attr=_strat_attr
                     )
             else:
                 return DataSectionVariable(
-                    _data=self.cube[var].data.values[:, self._y, self._x],
+                    _data=_slice(self.cube[var].data.values),
                     _s=self.s, _z=self.z
                     )
         elif type(self.cube) is cube.StratigraphyCube:
             return StratigraphySectionVariable(
-                _data=self.cube[var].data.values[:, self._y, self._x],
+                _data=_slice(self.cube[var].data.values),
                 _s=self.s, _z=self.z
                 )
-        elif self.cube is None:
-            raise AttributeError(
-                'No cube connected. Are you sure you ran `.connect()`?')
         else:
             raise TypeError('Unknown Cube type encountered: %s'
                             % type(self.cube))
 
+    def _get_section_strat_attr(self):
+        """Get the stratigraphy attributes of the section, computed once.
+
+        The attributes are cached along with the cube stratigraphy
+        attributes they were computed from, so they are recomputed only if
+        the cube stratigraphy changes (or the cube is reconnected). The
+        arrays are shared by every SectionVariable from the section, and so
+        are marked read-only.
+        """
+        _cube_strat_attr = self.cube.strat_attr
+        if (self._strat_attr_cache is None) or \
+                (self._strat_attr_cache[0] is not _cube_strat_attr):
+            _y, _x = self._section_index
+            _strat_attr = _cube_strat_attr('section', _y, _x)
+            for _val in _strat_attr.values():
+                if isinstance(_val, np.ndarray):
+                    _val.setflags(write=False)
+            self._strat_attr_cache = (_cube_strat_attr, _strat_attr)
+        return self._strat_attr_cache[1]
+
     def show(self, SectionAttribute, style='shaded', data=None,
              label=False, colorbar=True, colorbar_label=False, ax=None):
         """Show the section.
@@ -466,28 +655,33 @@ class BaseSection(abc.ABC):
         # process arguments and inputs
         if not ax:
             ax = plt.gca()
-        _varinfo = self.cube.varset[SectionAttribute] if \
-            issubclass(type(self.cube), cube.BaseCube) else \
-            plot.VariableSet()[SectionAttribute]
+        # slicing raises if no cube is connected; connected cubes are always
+        #   a BaseCube subclass (checked in `connect`), with a `varset`
         SectionVariableInstance = self[SectionAttribute]
+        _varinfo = self.cube.varset[SectionAttribute]
+
+        # resolve and validate the kind of data once, for either style
+        _kind = plot._get_display_data_kind(SectionVariableInstance, data)
 
         # main routines for plot styles
         if style in ['shade', 'shaded']:
-            _data, _X, _Y = plot.get_display_arrays(SectionVariableInstance,
-                                                    data=data)
+            _data, _X, _Y = plot._get_display_arrays_kind(
+                SectionVariableInstance, _kind)
             ci = ax.pcolormesh(_X, _Y, _data, cmap=_varinfo.cmap,
                                norm=_varinfo.norm,
                                vmin=_varinfo.vmin, vmax=_varinfo.vmax,
                                rasterized=True, shading='auto')
         elif style in ['line', 'lines']:
-            _data, _segments = plot.get_display_lines(SectionVariableInstance,
-                                                      data=data)
+            _data, _segments = plot._get_display_lines_kind(
+                SectionVariableInstance, _kind)
             lc = LineCollection(_segments, cmap=_varinfo.cmap)
-            lc.set_array(_data.flatten())
+            lc.set_array(_data.ravel())  # copies only if not contiguous
             lc.set_linewidth(1.25)
             ci = ax.add_collection(lc)
         else:
             raise ValueError('Bad style argument: "%s"' % style)
+        xmin, xmax, ymin, ymax = plot._get_display_limits_kind(
+            SectionVariableInstance, _kind)
 
         # style adjustments
         if colorbar:
@@ -503,8 +697,6 @@ class BaseSection(abc.ABC):
             ax.text(0.99, 0.8, _label, fontsize=10,
                     horizontalalignment='right', verticalalignment='center',
                     transform=ax.transAxes)
-        xmin, xmax, ymin, ymax = plot.get_display_limits(
-            SectionVariableInstance, data=data)
         ax.set_xlim(xmin, xmax)
         ax.set_ylim(ymin, ymax)
 
@@ -722,11 +914,30 @@ class StrikeSection(BaseSection):
         """
         if self._input_xlim is None:
             _nx = self.cube['eta'].shape[2]
-            self._x = np.arange(_nx)
+            self._x = np.arange(_nx, dtype=np.intp)
         else:
-            self._x = np.arange(self._input_xlim[0], self._input_xlim[1])
+            self._x = np.arange(self._input_xlim[0], self._input_xlim[1],
+                                dtype=np.intp)
             _nx = len(self._x)
-        self._y = np.tile(self.y, (_nx))
+        self._x.setflags(write=False)  # coordinates are never modified
+        # constant y, broadcast (no copy) to match the x coordinates
+        self._y = np.broadcast_to(self.y, (_nx,))
+
+    @property
+    def _section_index(self):
+        """Index into the `x-y` plane of the cube to extract the section.
+
+        The strike section lies at a single `y` and spans a contiguous range
+        of `x`, so the cube can be sliced with a scalar and a basic slice.
+        This returns a view of the cube data, rather than a copy.
+        """
+        if (self._x.size > 0) and (self._x[0] >= 0) and \
+                (self._x[-1] < self.cube.W):
+            return self.y, slice(self._x[0], self._x[-1] + 1)
+        else:
+            # x limits outside the cube, fall back to index arrays, which
+            #   wrap negative indices and raise for indices past the edge
+            return self._y, self._x
 
 
 class DipSection(BaseSection):
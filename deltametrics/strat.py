@@ -217,6 +217,11 @@ class MeshStratigraphyAttributes(BaseStratigraphyAttributes):
     -----
     Some descriptions regarding implementation.
 
+    strata : :obj:`ndarray` of `float32`
+        Elevation of stratal surfaces, stored in single precision regardless
+        of the precision of the input elevation (strata are only used for
+        display).
+
     _psvd_idx : :obj:`ndarray` of `bool`
         Preserved index into the section array.
 
@@ -255,10 +260,13 @@ class MeshStratigraphyAttributes(BaseStratigraphyAttributes):
         _eta = elev.data.copy()
         _strata, _psvd = _compute_elevation_to_preservation(_eta)
         _psvd[0, ...] = True
-        self.strata = _strata
+        # strata are only used for display, so float32 precision is ample
+        self.strata = _strata.astype(np.float32, copy=False)
 
-        self.psvd_vxl_cnt = _psvd.sum(axis=0, dtype=int)
-        self.psvd_vxl_idx = _psvd.cumsum(axis=0, dtype=int)
+        # voxel counts and indices are bounded by the number of time steps,
+        #   so are stored as int32 to halve index memory traffic
+        self.psvd_vxl_cnt = _psvd.sum(axis=0, dtype=np.int32)
+        self.psvd_vxl_idx = _psvd.cumsum(axis=0, dtype=np.int32)
         self.psvd_vxl_cnt_max = int(self.psvd_vxl_cnt.max())
         self.psvd_idx = _psvd.astype(bool)  # guarantee bool
 
@@ -305,11 +313,14 @@ class MeshStratigraphyAttributes(BaseStratigraphyAttributes):
             strat_attr['psvd_idx'] = _psvd_idx = self.psvd_idx[:, _x0, _x1]
             strat_attr['psvd_flld'] = self.psvd_flld[:, _x0, _x1]
             strat_attr['x0'] = _i = self.psvd_vxl_idx[:, _x0, _x1]
-            strat_attr['x1'] = _j = np.tile(np.arange(_i.shape[1]),
+            strat_attr['x1'] = _j = np.tile(np.arange(_i.shape[1],
+                                                      dtype=np.int32),
                                             (_i.shape[0], 1))
             strat_attr['s'] = _j[0, :]          # along-sect coord
             strat_attr['s_sp'] = _j[_psvd_idx]  # along-sect coord, sparse
             strat_attr['z_sp'] = _i[_psvd_idx]  # vert coord, sparse
+            strat_attr['sp_shape'] = (  # shape of sparse strat matrix
+                int(self.psvd_vxl_cnt[_x0, _x1].max()) + 1, _i.shape[1])
 
         elif _dir == 'plan':
             raise NotImplementedError
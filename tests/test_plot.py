@@ -365,7 +365,8 @@ class TestGetDisplayArrays:
         _data, _X, _Y = plot.get_display_arrays(self.dsv,
                                                 data='preserved')
         assert (_data.shape == _X.shape) and (_data.shape == _Y.shape)
-        assert np.any(~_data._mask)  # check that some are False
+        assert np.any(~np.isnan(_data))  # check that some are preserved
+        assert np.all(np.isnan(_data[~self.dsv._psvd_mask]))
 
     def test_dsv_get_display_arrays_stratigraphy(self):
         _data, _X, _Y = plot.get_display_arrays(self.dsv,
@@ -403,6 +404,57 @@ class TestGetDisplayArrays:
                 self.ssv, data='badstring')
 
 
+class TestGetDisplayBundle:
+
+    rcm8cube_nostrat = cube.DataCube(rcm8_path)
+    rcm8cube_nostrat.register_section('test', section.StrikeSection(y=5))
+    dsv_nostrat = rcm8cube_nostrat.sections['test']['velocity']
+
+    rcm8cube = cube.DataCube(rcm8_path)
+    rcm8cube.stratigraphy_from('eta')
+    rcm8cube.register_section('test', section.StrikeSection(y=5))
+    dsv = rcm8cube.sections['test']['velocity']
+
+    sc8cube = cube.StratigraphyCube.from_DataCube(rcm8cube)
+    sc8cube.register_section('test', section.StrikeSection(y=5))
+    ssv = sc8cube.sections['test']['velocity']
+
+    def test_dsv_get_display_bundle_default(self):
+        _bundle = plot.get_display_bundle(self.dsv)
+        assert len(_bundle) == 7
+        _data, _X, _Y = plot.get_display_arrays(self.dsv)
+        assert np.all(_bundle[0] == _data)
+        assert _bundle[3:] == plot.get_display_limits(self.dsv)
+
+    def test_dsv_get_display_bundle_stratigraphy(self):
+        _bundle = plot.get_display_bundle(self.dsv, data='stratigraphy')
+        assert _bundle[3:] == plot.get_display_limits(self.dsv,
+                                                      data='stratigraphy')
+
+    def test_dsv_get_display_bundle_badstring(self):
+        with pytest.raises(ValueError, match=r'Bad data *.'):
+            plot.get_display_bundle(self.dsv, data='badstring')
+
+    def test_dsv_nostrat_get_display_bundle_stratigraphy(self):
+        with pytest.raises(utils.NoStratigraphyError):
+            plot.get_display_bundle(self.dsv_nostrat, data='stratigraphy')
+
+    def test_ssv_get_display_bundle_stratigraphy(self):
+        _bundle = plot.get_display_bundle(self.ssv)
+        _data, _X, _Y = plot.get_display_arrays(self.ssv)
+        np.testing.assert_array_equal(_bundle[0], _data)  # data holds NaN
+        assert _bundle[3:] == plot.get_display_limits(self.ssv)
+
+    def test_ssv_get_display_bundle_spacetime(self):
+        with pytest.raises(AttributeError,
+                           match=r'No "spacetime" or "preserved"*.'):
+            plot.get_display_bundle(self.ssv, data='spacetime')
+
+    def test_get_display_bundle_badtype(self):
+        with pytest.raises(TypeError):
+            plot.get_display_bundle(np.zeros((10, 10)))
+
+
 class TestGetDisplayLines:
 
     rcm8cube_nostrat = cube.DataCube(rcm8_path)
@@ -515,6 +567,9 @@ class TestGetDisplayLimits:
     def test_dsv_get_display_limits_stratigraphy(self):
         _lims = plot.get_display_limits(self.dsv, data='stratigraphy')
         assert len(_lims) == 4
+        _strata = self.dsv.strat_attr['strata']
+        assert _lims[2] == np.min(_strata)
+        assert _lims[3] == np.max(_strata) * 1.5
 
     def test_dsv_get_display_limits_badstring(self):
         with pytest.raises(ValueError, match=r'Bad data*.'):
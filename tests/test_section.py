@@ -73,6 +73,48 @@ class TestStrikeSection:
         assert np.all(rcm8cube.sections['list']._y == 5)
         assert np.all(rcm8cube.sections['tuple']._y == 5)
 
+    def test_StrikeSection_data_matches_index_arrays(self):
+        rcm8cube = cube.DataCube(rcm8_path)
+        rcm8cube.register_section('test', section.StrikeSection(y=5,
+                                                                x=(10, 110)))
+        _sect = rcm8cube.sections['test']
+        _arr = rcm8cube['velocity'].data.values[:, _sect._y, _sect._x]
+        assert _sect['velocity'].shape == _arr.shape
+        assert np.all(_sect['velocity'] == _arr)
+
+    def test_StrikeSection_data_readonly_cube_unchanged(self):
+        rcm8cube = cube.DataCube(rcm8_path)
+        _sect = section.StrikeSection(rcm8cube, y=5)
+        _before = np.copy(rcm8cube['velocity'].data.values[:, 5, :])
+        _sv = _sect['velocity']
+        with pytest.raises(ValueError, match=r'.*read-only.*'):
+            _sv *= 2
+        with pytest.raises(ValueError, match=r'.*read-only.*'):
+            _sv[0] = 0
+        assert np.all(rcm8cube['velocity'].data.values[:, 5, :] == _before)
+        assert np.all(_sv * 2 == _before * 2)  # new arrays are fine
+
+    def test_StrikeSection_negative_x_limits_fallback(self):
+        rcm8cube = cube.DataCube(rcm8_path)
+        rcm8cube.register_section('test', section.StrikeSection(y=5,
+                                                                x=(-20, -10)))
+        _sect = rcm8cube.sections['test']
+        _y, _x = _sect._section_index
+        assert not isinstance(_x, slice)  # index arrays, not a slice
+        _arr = rcm8cube['velocity'].data.values[:, 5, -20:-10]
+        assert _sect['velocity'].shape == (51, 10)
+        assert np.all(_sect['velocity'] == _arr)
+
+    def test_StrikeSection_out_of_range_x_limits_fallback(self):
+        rcm8cube = cube.DataCube(rcm8_path)
+        rcm8cube.register_section('test', section.StrikeSection(y=10,
+                                                                x=(100, 400)))
+        _sect = rcm8cube.sections['test']
+        _y, _x = _sect._section_index
+        assert not isinstance(_x, slice)  # index arrays, not a slice
+        with pytest.raises(IndexError):
+            _sect['velocity']
+
 
 class TestPathSection:
     """Test the basic of the PathSection."""
@@ -642,6 +684,24 @@ class TestSectionFromDataCubeWithStratigraphy:
         s1 = self.rcm8cube.sections['test']['velocity']
         assert np.all(s1 + s1 == s1 * 2)
 
+    def test_withstrat_SectionVariable_strat_attr_cached(self):
+        _sect = self.rcm8cube.sections['test']
+        s1 = _sect['velocity']
+        s2 = _sect['depth']
+        assert s2 is not s1
+        assert s2.strat_attr is s1.strat_attr
+        assert not s1.strat_attr['strata'].flags.writeable
+
+    def test_withstrat_SectionVariable_writable(self):
+        _sect = section.PathSection(
+            self.rcm8cube, path=np.array([[50, 3], [65, 17], [130, 10]]))
+        s1 = _sect['velocity']
+        _before = np.array(s1)
+        s1[s1 < 0.1] = np.nan
+        s1 += 1
+        assert _sect['velocity'] is not s1
+        assert np.all(_sect['velocity'] == _before)
+
     def test_withstrat_strat_attr_mesh_components(self):
         sa = self.rcm8cube.sections['test']['velocity'].strat_attr
         assert 'strata' in sa.keys()
@@ -652,6 +712,7 @@ class TestSectionFromDataCubeWithStratigraphy:
         assert 's' in sa.keys()
         assert 's_sp' in sa.keys()
         assert 'z_sp' in sa.keys()
+        assert 'sp_shape' in sa.keys()
 
     def test_withstrat_strat_attr_shapes(self):
         sa = self.rcm8cube.sections['test']['velocity'].strat_attr
@@ -659,6 +720,10 @@ class TestSectionFromDataCubeWithStratigraphy:
         assert sa['x1'].shape == (51, 240)
         assert sa['s'].shape == (240,)
         assert sa['s_sp'].shape == sa['z_sp'].shape
+        assert sa['sp_shape'] == (np.max(sa['z_sp']) + 1, 240)
+        assert sa['s_sp'].dtype == np.int32
+        assert sa['z_sp'].dtype == np.int32
+        assert sa['strata'].dtype == np.float32
 
     def test_withstrat_show_shaded_spacetime(self):
         self.rcm8cube.sections['test'].show('time', style='shaded',
@@ -880,10 +945,18 @@ class TestDataSectionVariableNoStratigraphy:
         with pytest.raises(utils.NoStratigraphyError):
             self.dsv.as_preserved()
 
+    def test_dsv_as_preserved_nan(self):
+        with pytest.raises(utils.NoStratigraphyError):
+            self.dsv.as_preserved_nan()
+
     def test_dsv_as_stratigraphy(self):
         with pytest.raises(utils.NoStratigraphyError):
             self.dsv.as_stratigraphy()
 
+    def test_dsv_as_stratigraphy_sparse(self):
+        with pytest.raises(utils.NoStratigraphyError):
+            self.dsv.as_stratigraphy_sparse()
+
 
 class TestDataSectionVariableWithStratigraphy:
 
@@ -935,11 +1008,59 @@ class TestDataSectionVariableWithStratigraphy:
         assert _arr.shape == self.dsv.shape
         assert isinstance(_arr, np.ma.MaskedArray)
 
+    def test_dsv_as_preserved_writable(self):
+        _arr = np.random.rand(100, 200)
+        _mask = np.random.randint(0, 2, (100, 200), dtype=bool)
+        _dsv = section.DataSectionVariable(
+            _arr, np.arange(200), np.linspace(0, 10, num=100),
+            _psvd_mask=_mask, _strat_attr={})
+        _ma = _dsv.as_preserved()
+        _ma[0, 0] = -999
+        _ma[_ma > 0.5] = np.ma.masked
+        assert _dsv[0, 0] == -999  # data is shared with the variable
+        assert np.all(_dsv._psvd_mask == _mask)  # mask is independent
+        assert np.all(_dsv.as_preserved().mask == ~_mask)
+
+    def test_dsv_inv_psvd_mask_lazy(self):
+        _arr = np.random.rand(100, 200)
+        _mask = np.random.randint(0, 2, (100, 200), dtype=bool)
+        _dsv = section.DataSectionVariable(
+            _arr, np.arange(200), np.linspace(0, 10, num=100),
+            _psvd_mask=_mask, _strat_attr={})
+        assert '_inv_psvd_mask_cache' not in _dsv.__dict__
+        _inv = _dsv._inv_psvd_mask
+        assert np.all(_inv == ~_mask)
+        assert _dsv._inv_psvd_mask is _inv
+        assert not _inv.flags.writeable
+        assert np.shares_memory(_dsv._as_preserved_display().mask, _inv)
+
+    def test_dsv_as_preserved_nan(self):
+        _arr = self.dsv.as_preserved_nan()
+        _ma = self.dsv.as_preserved()
+        assert _arr.shape == self.dsv.shape
+        assert not isinstance(_arr, np.ma.MaskedArray)
+        assert np.all(np.isnan(_arr[_ma.mask]))
+        assert np.any(~np.isnan(_arr))
+
     def test_dsv_as_stratigraphy(self):
         _arr = self.dsv.as_stratigraphy()
         assert _arr.shape == (np.max(self.dsv.strat_attr['z_sp']) + 1,
                               self.dsv.shape[1])
 
+    def test_dsv_as_stratigraphy_jit_scatter(self, monkeypatch):
+        _arr = self.dsv.as_stratigraphy()
+        # force the compiled path
+        monkeypatch.setattr(section.DataSectionVariable,
+                            '_jit_scatter_size', 0)
+        _jit_arr = self.dsv.as_stratigraphy()
+        assert np.all(_jit_arr == _arr)
+
+    def test_dsv_as_stratigraphy_sparse(self):
+        _sp = self.dsv.as_stratigraphy_sparse()
+        _arr = self.dsv.as_stratigraphy()
+        assert _sp.shape == _arr.shape
+        assert np.all(_sp.toarray() == _arr)
+
 
 class TestStratigraphySectionVariable:
 
@@ -239,6 +239,20 @@ class TestComputePreservationToCube:
         # assert np.all(sc1 == np.array([3, 2, 1, 0]))
 
 
+class TestMeshStratigraphyAttributes:
+
+    def test_strata_float32_from_float64_elevation(self):
+        _eta = np.cumsum(np.random.rand(10, 4, 5) - 0.4, axis=0)
+        assert _eta.dtype == np.float64
+        _elev = xr.DataArray(_eta).cubevar
+        _elev.initialize(variable='eta')
+        sa = strat.MeshStratigraphyAttributes(_elev)
+        assert sa.strata.dtype == np.float32
+        assert sa.strata.shape == (10, 4, 5)
+        _strata, _ = strat._compute_elevation_to_preservation(_eta)
+        assert np.allclose(sa.strata, _strata.astype(np.float32))
+
+
 class TestOneDimStratigraphyExamples:
     """Tests for various cases of 1d stratigraphy."""
 